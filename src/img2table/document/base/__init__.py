@@ -1,5 +1,6 @@
 import io
 import typing
+from collections.abc import Iterator
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
@@ -59,14 +60,15 @@ class Document(Validations):
         return None
 
     @property
-    def images(self) -> list[np.ndarray]:
+    def images(self) -> Iterator[np.ndarray]:
         raise NotImplementedError
 
-    def get_table_content(self, tables: dict[int, list["Table"]], ocr: "OCRInstance",
+    def get_table_content(self, tables: dict[int, list["Table"]], images: dict[int, np.ndarray], ocr: "OCRInstance",
                           min_confidence: int) -> dict[int, list[ExtractedTable]]:
         """
         Retrieve table content with OCR
         :param tables: dictionary containing extracted tables by page
+        :param images: dictionary containing page images by page
         :param ocr: OCRInstance object used to extract table content
         :param min_confidence: minimum confidence level from OCR in order to process text, from 0 (worst) to 99 (best)
         :return: dictionary with page number as key and list of extracted tables as values
@@ -78,7 +80,7 @@ class Document(Validations):
             return {k: [tb.extracted_table for tb in v] for k, v in tables.items()}
 
         # Create document containing only pages
-        ocr_doc = MockDocument(images=[self.images[page] for page in table_pages])
+        ocr_doc = MockDocument(images=[images[page] for page in table_pages])
 
         # Get OCRDataFrame object
         if self.ocr_df is None and ocr is not None:
@@ -99,7 +101,7 @@ class Document(Validations):
 
             # Retrieve titles
             from img2table.tables.processing.text.titles import get_title_tables
-            tables[page] = get_title_tables(img=self.images[page],
+            tables[page] = get_title_tables(img=images[page],
                                             tables=tables[page],
                                             ocr_df=ocr_df_page)
 
@@ -122,18 +124,22 @@ class Document(Validations):
         :param min_confidence: minimum confidence level from OCR in order to process text, from 0 (worst) to 99 (best)
         :return: dictionary with page number as key and list of extracted tables as values
         """
-        # Extract tables from document
         from img2table.tables.image import TableImage
-        tables = {idx: TableImage(img=img,
-                                  min_confidence=min_confidence).extract_tables(implicit_rows=implicit_rows,
-                                                                                implicit_columns=implicit_columns,
-                                                                                borderless_tables=borderless_tables)
-                  for idx, img in enumerate(self.images)}
-
-        # Update table content with OCR if possible
-        tables = self.get_table_content(tables=tables,
-                                        ocr=ocr,
-                                        min_confidence=min_confidence)
+
+        # Process pages one at a time in order to keep a single page image in memory
+        tables = {}
+        for idx, img in enumerate(self.images):
+            # Extract tables from page
+            page_tables = {idx: TableImage(img=img,
+                                           min_confidence=min_confidence).extract_tables(implicit_rows=implicit_rows,
+                                                                                         implicit_columns=implicit_columns,
+                                                                                         borderless_tables=borderless_tables)}
+
+            # Update table content with OCR if possible
+            tables.update(self.get_table_content(tables=page_tables,
+                                                 images={idx: img},
+                                                 ocr=ocr,
+                                                 min_confidence=min_confidence))
 
         # If pages have been defined, modify tables keys
         if self.pages:
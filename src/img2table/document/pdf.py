@@ -1,4 +1,5 @@
 import typing
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Optional, Any
 
@@ -43,44 +44,53 @@ class PDF(Document):
     def validate__images(self, value: Any, **_) -> int:
         return value
 
+    def _render_page(self, doc: pypdfium2.PdfDocument, page_number: int) -> np.ndarray:
+        """
+        Render PDF page to image
+        :param doc: pypdfium2 PdfDocument object
+        :param page_number: page index in PDF
+        :return: image array of the page
+        """
+        page = doc[page_number]
+        img = cv2.cvtColor(page.render(scale=200 / 72).to_numpy(), cv2.COLOR_BGR2RGB)
+        page.close()
+
+        # Handle rotation if needed
+        if self.detect_rotation:
+            final, self._rotated = fix_rotation_image(img=img)
+        else:
+            final, self._rotated = img, False
+        return final
+
     @property
-    def images(self) -> list[np.ndarray]:
+    def images(self) -> Iterator[np.ndarray]:
         if self._images is not None:
-            return self._images
+            yield from self._images
+            return
 
+        # Render pages lazily, so that only the current page is held in memory
         doc = pypdfium2.PdfDocument(input=self.bytes)
+        try:
+            for page_number in self.pages or range(len(doc)):
+                yield self._render_page(doc=doc, page_number=page_number)
+        finally:
+            doc.close()
 
-        # Get all images
-        images = []
-        for page_number in self.pages or range(len(doc)):
-            page = doc[page_number]
-            img = cv2.cvtColor(page.render(scale=200 / 72).to_numpy(), cv2.COLOR_BGR2RGB)
-            # Handle rotation if needed
-            if self.detect_rotation:
-                final, self._rotated = fix_rotation_image(img=img)
-            else:
-                final, self._rotated = img, False
-            images.append(final)
-
-        self._images = images
-        doc.close()
-        return images
-
-    def get_table_content(self, tables: dict[int, list["Table"]], ocr: "OCRInstance",
+    def get_table_content(self, tables: dict[int, list["Table"]], images: dict[int, np.ndarray], ocr: "OCRInstance",
                           min_confidence: int) -> dict[int, list["ExtractedTable"]]:
         if not self._rotated and self.pdf_text_extraction:
             # Get pages where tables have been detected
             table_pages = [self.pages[k] if self.pages else k for k, v in tables.items() if len(v) > 0]
-            images = [self.images[k] for k, v in tables.items() if len(v) > 0]
+            table_images = [images[k] for k, v in tables.items() if len(v) > 0]
 
             if table_pages:
                 # Create PDF object for OCR
                 pdf_ocr = PDF(src=self.bytes,
                               pages=table_pages,
-                              _images=images,
+                              _images=table_images,
                               _rotated=self._rotated)
 
                 # Try to get OCRDataframe from PDF
                 self.ocr_df = PdfOCR().of(document=pdf_ocr)
 
-        return super().get_table_content(tables=tables, ocr=ocr, min_confidence=min_confidence)
+        return super().get_table_content(tables=tables, images=images, ocr=ocr, min_confidence=min_confidence)
@@ -33,7 +33,7 @@ class DocTR(OCRInstance):
 
     def content(self, document: Document) -> "doctr.io.elements.Document":
         # Get OCR of all images
-        return self.model(document.images)
+        return self.model(list(document.images))
 
     def to_ocr_dataframe(self, content: "doctr.io.elements.Document") -> OCRDataframe:
         """
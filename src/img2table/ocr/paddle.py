@@ -125,7 +125,7 @@ class PaddleOCR3(OCRInstance):
         self.ocr = OCR(**kw)
 
     def content(self, document: Document) -> list[dict]:
-        ocrs = self.ocr.predict(input=document.images)
+        ocrs = self.ocr.predict(input=list(document.images))
         return [{"rec_texts": res["rec_texts"],
                  "rec_scores": res["rec_scores"],
                  "rec_boxes": [bbox.tolist() for bbox in res["rec_boxes"]]}
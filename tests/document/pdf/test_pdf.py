@@ -1,5 +1,6 @@
 # coding: utf-8
 import sys
+from collections.abc import Iterator
 from io import BytesIO
 
 import pytest
@@ -45,6 +46,17 @@ def test_pdf_pages():
     assert len(list(PDF(src="test_data/test.pdf", pages=[0]).images)) == 1
 
 
+def test_pdf_lazy_images():
+    pdf = PDF(src="test_data/test.pdf")
+
+    images = pdf.images
+    assert isinstance(images, Iterator)
+
+    # Pages are rendered one at a time and not stored
+    assert next(images).shape == (2200, 1700, 3)
+    assert pdf._images is None
+
+
 def test_pdf_tables(mock_tesseract):
     ocr = TesseractOCR()
     pdf = PDF(src="test_data/test.pdf")